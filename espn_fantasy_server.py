@@ -1,30 +1,278 @@
 from mcp.server.fastmcp import FastMCP
-from espn_api.football import League, Team
+from mcp.types import TextContent
+from espn_api.football import League
+from espn_api.requests.espn_requests import EspnFantasyRequests, ESPNAccessDenied, checkRequestStatus
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from requests.adapters import HTTPAdapter
+from typing import NotRequired, TypedDict, cast
+import requests
+import asyncio
+import hashlib
+import http.cookiejar
 import json
 import os
+import re
 import sys
+import tempfile
+import threading
 import datetime
 import logging
+import time
 import traceback
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+# orjson is optional; when it's installed tool results are serialized with it instead of the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Set up logging (set ESPN_FF_LOG_LEVEL=DEBUG to include tracebacks for tool errors)
+# Unknown names fall back to INFO rather than failing at import
+LOG_LEVEL = logging.getLevelNamesMapping().get(os.environ.get("ESPN_FF_LOG_LEVEL", "INFO").upper(), logging.INFO)
+logging.basicConfig(level=LOG_LEVEL)
 logger = logging.getLogger("espn-fantasy-football")
 
+PRIVATE_LEAGUE_MESSAGE = ("This appears to be a private league. Please use the authenticate tool first with your "
+                          "ESPN_S2 and SWID cookies to access private leagues.")
+# Fallback for auth failures that don't surface as ESPNAccessDenied. 401 must be a whole number so league IDs
+# containing it (e.g. "League 1401234 does not exist") aren't mistaken for private leagues
+PRIVATE_LEAGUE_ERROR = re.compile(r"\b401\b|Private")
+
 # Add stderr logging for Claude Desktop to see
 def log_error(message):
     print(message, file=sys.stderr)
 
+def log_exception(message, e):
+    """Log a failed tool call, only paying to format the traceback when debug logging is on"""
+    logger.error("%s: %s", message, e, exc_info=logger.isEnabledFor(logging.DEBUG))
+
+def handle_error(message, e) -> str:
+    """Log a failed tool call and build the error message returned to the client"""
+    log_exception(message, e)
+    error = str(e)
+    if isinstance(e, ESPNAccessDenied) or PRIVATE_LEAGUE_ERROR.search(error):
+        return PRIVATE_LEAGUE_MESSAGE
+    return f"{message}: {error}"
+
+@lru_cache(maxsize=1)
 def get_credentials():
+    """Load secrets.json once per process; call get_credentials.cache_clear() to pick up changes"""
     try:
-        with open('./.venv/secrets.json', 'r') as f:
+        with open('./.venv/secrets.json', 'rb') as f:
             return json.load(f)
     except FileNotFoundError:
         log_error("Error: secrets.json file not found. Please create a secrets.json file in the .venv directory with your ESPN_S2 and SWID cookies in order to authenticate automatically.")
         return None
     
+def to_json(obj) -> str:
+    """Serialize a tool result as compact JSON, falling back to str() for anything JSON doesn't know about"""
+    if orjson:
+        # Player stats are keyed by scoring period ints, which orjson only accepts with OPT_NON_STR_KEYS
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, default=str, separators=(",", ":"))
+
+def tool_result(result) -> str:
+    """Serialize a tool implementation's result. Messages (e.g. for invalid input) are already text and pass through as is"""
+    return result if isinstance(result, str) else to_json(result)
+
+def parse_fields(fields) -> dict:
+    """Turn dotted field paths (e.g. "home_lineup.weekly_stats.points") into a nested dict, where None means keep the whole value"""
+    tree = {}
+    for field in fields:
+        node = tree
+        *parents, leaf = field.split(".")
+        for part in parents:
+            node = node.setdefault(part, {})
+            if node is None:  # an ancestor is already kept whole
+                break
+        else:
+            node[leaf] = None
+    return tree
+
+def project_fields(value, tree):
+    """Keep only the fields in a tree from parse_fields. Lists are projected item by item"""
+    if tree is None:
+        return value
+    if isinstance(value, list):
+        return [project_fields(item, tree) for item in value]
+    if isinstance(value, dict):
+        return {key: project_fields(item, tree[key]) for key, item in value.items() if key in tree}
+    return value
+
 def get_owner_name(team) -> str|None:
-    return f"{team.owners[0]['firstName']} {team.owners[0]['lastName']}" if team.owners else None
+    # Memoized on the team, which is rebuilt whenever its league is
+    try:
+        return team._owner_name
+    except AttributeError:
+        team._owner_name = f"{team.owners[0]['firstName']} {team.owners[0]['lastName']}" if team.owners else None
+        return team._owner_name
+
+class LineupPlayer(TypedDict):
+    """A player in a matchup lineup, as returned by get_detailed_matchup_info"""
+    name: str
+    position: str
+    proTeam: str
+    injuryStatus: str
+    season_total_points: NotRequired[float]
+    projected_season_total_points: NotRequired[float]
+    lineupSlot: str
+    # Only present if the player has stats for the week (season/projected stats only for the current week)
+    season_stats: NotRequired[dict]
+    weekly_stats: NotRequired[dict]
+    projected_stats: NotRequired[dict]
+
+class MatchupSummary(TypedDict):
+    """A matchup as returned by get_weekly_matchups (and, with lineups, get_detailed_matchup_info)"""
+    home_team_id: int
+    home_team: str
+    home_team_owner_name: str | None
+    home_score: float
+    home_lineup: NotRequired[list[LineupPlayer]]
+    away_team_id: int | None
+    away_team: str
+    away_team_owner_name: str | None
+    away_score: float
+    away_lineup: NotRequired[list[LineupPlayer]]
+    winner: str
+
+def summarize_matchup(matchup, resolve_lineup=None) -> MatchupSummary:
+    """Summarize a box score's teams and scores. If resolve_lineup is given it's used to include each side's lineup"""
+    home, away = matchup.home_team, matchup.away_team
+    home_score, away_score = matchup.home_score, matchup.away_score
+    summary = {
+        "home_team_id": home.team_id,
+        "home_team": home.team_name,
+        "home_team_owner_name": get_owner_name(home),
+        "home_score": home_score,
+    }
+    if resolve_lineup:
+        summary["home_lineup"] = resolve_lineup(matchup.home_lineup)
+    summary["away_team_id"] = away.team_id if away else None
+    summary["away_team"] = away.team_name if away else "BYE"
+    summary["away_team_owner_name"] = get_owner_name(away) if away else None
+    summary["away_score"] = away_score if away else 0
+    if resolve_lineup:
+        summary["away_lineup"] = resolve_lineup(matchup.away_lineup) if away else []
+    summary["winner"] = "HOME" if home_score > away_score else "AWAY" if away_score > home_score else "TIE"
+    # Built key by key to keep each lineup next to its team, which type checkers can't infer a TypedDict from
+    return cast(MatchupSummary, summary)
+
+# Timeout (seconds) applied to every ESPN request
+HTTP_TIMEOUT = 10
+# Max number of ESPN fetches run at once when fanning out over several weeks
+MAX_CONCURRENT_FETCHES = 8
+# Keep-alive connections held open to ESPN. Sized so a full multi-week fan-out plus other tool calls running
+# alongside it never wait on a free connection or have theirs discarded when the pool is full
+HTTP_POOL_SIZE = 2 * MAX_CONCURRENT_FETCHES
+# How long (seconds) fetched box scores are reused, and how many weeks are kept around
+BOX_SCORES_TTL = 60
+BOX_SCORES_CACHE_SIZE = 128
+# Max number of League objects kept in memory before the least recently used one is dropped
+LEAGUE_CACHE_SIZE = 32
+# How many revalidatable responses each league keeps before dropping the least recently used one. Each week's box
+# scores take two (plus a pro schedule shared by every week), so this fits a full season scan and still stops the
+# parsed bodies of every other request piling up for as long as the league is cached
+VALIDATED_RESPONSES_SIZE = 64
+# Where ESPN responses for completed seasons are saved, so they survive server restarts
+DISK_CACHE_DIR = Path(os.environ.get("ESPN_FF_CACHE_DIR", "./.espn_cache"))
+
+@lru_cache(maxsize=1)
+def get_http_session() -> requests.Session:
+    """Shared HTTP session so every league reuses the same pool of keep-alive connections to ESPN"""
+    session = requests.Session()
+    # Refuse cookies ESPN sets, so credentials never carry over between leagues, sessions or a logout. Only the
+    # cookies passed with each request are sent
+    session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=HTTP_POOL_SIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+class PooledEspnFantasyRequests(EspnFantasyRequests):
+    """EspnFantasyRequests that sends everything through the shared session instead of a fresh connection per call,
+    and revalidates responses it has already seen so unchanged data comes back as a 304 instead of a full body.
+    With disk_cache=True (for seasons that are over) responses are also saved under DISK_CACHE_DIR and reused across restarts"""
+
+    def __init__(self, *args, disk_cache: bool = False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.disk_cache = disk_cache
+        # LRU of request -> (conditional request headers, parsed body) for responses that carried an ETag or Last-Modified
+        self.validated_responses = OrderedDict()
+        # League methods like box_scores run in several worker threads at once, all sharing this request object
+        self.validated_responses_lock = threading.Lock()
+
+    def fetch_json(self, endpoint: str, params: dict = None, headers: dict = None, **status_kwargs):
+        key = (endpoint, json.dumps(params, sort_keys=True), json.dumps(headers, sort_keys=True))
+
+        cache_file = None
+        if self.disk_cache:
+            # Cookies are part of the file name so private league data is only reused with the same credentials
+            digest = hashlib.sha256(repr((key, sorted((self.cookies or {}).items()))).encode()).hexdigest()
+            cache_file = DISK_CACHE_DIR / f"{digest}.json"
+            try:
+                return json.loads(cache_file.read_bytes())
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError) as e:
+                # A corrupt file is just a miss; drop it so the fresh response below replaces it
+                log_error(f"Ignoring unreadable disk cache entry {cache_file.name}: {str(e)}")
+                cache_file.unlink(missing_ok=True)
+
+        with self.validated_responses_lock:
+            cached = self.validated_responses.get(key)
+            if cached:
+                self.validated_responses.move_to_end(key)
+        request_headers = {**(headers or {}), **cached[0]} if cached else headers
+
+        r = get_http_session().get(endpoint, params=params, headers=request_headers, cookies=self.cookies, timeout=HTTP_TIMEOUT)
+        if r.status_code == 304 and cached:
+            return cached[1]
+        checkRequestStatus(r.status_code, **status_kwargs)
+
+        data = r.json()
+        validators = {}
+        if r.headers.get('ETag'):
+            validators['If-None-Match'] = r.headers['ETag']
+        if r.headers.get('Last-Modified'):
+            validators['If-Modified-Since'] = r.headers['Last-Modified']
+        # Disk cached seasons never hit ESPN for this request again, so there's nothing to revalidate
+        with self.validated_responses_lock:
+            if validators and not cache_file:
+                self.validated_responses[key] = (validators, data)
+                self.validated_responses.move_to_end(key)
+                while len(self.validated_responses) > VALIDATED_RESPONSES_SIZE:
+                    self.validated_responses.popitem(last=False)
+            else:
+                self.validated_responses.pop(key, None)
+
+        if cache_file:
+            temp_file = None
+            try:
+                DISK_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                # Write to a temp file and move it into place, so readers never see a partly written entry
+                fd, temp_name = tempfile.mkstemp(dir=DISK_CACHE_DIR, suffix=".tmp")
+                temp_file = Path(temp_name)
+                with os.fdopen(fd, "wb") as f:
+                    f.write(r.content)
+                os.replace(temp_file, cache_file)
+            except OSError as e:
+                log_error(f"Could not write ESPN response to disk cache: {str(e)}")
+                if temp_file:
+                    temp_file.unlink(missing_ok=True)
+
+        if self.logger:
+            self.logger.log_request(endpoint=endpoint, params=params, headers=headers, response=data)
+        return data
+
+    def league_get(self, params: dict = None, headers: dict = None, extend: str = ''):
+        data = self.fetch_json(self.LEAGUE_ENDPOINT + extend, params=params, headers=headers,
+                               cookies=self.cookies, league_id=self.league_id)
+        return data if self.year > 2017 else data[0]
+
+    def get(self, params: dict = None, headers: dict = None, extend: str = ''):
+        return self.fetch_json(self.ENDPOINT + extend, params=params, headers=headers)
 
 try:
     # Initialize FastMCP server
@@ -43,7 +291,9 @@ try:
 
     class ESPNFantasyFootballAPI:
         def __init__(self):
-            self.leagues = {}  # Cache for league objects
+            self.leagues = OrderedDict()  # LRU cache for league objects, most recently used last
+            self.league_locks = {}  # league cache key -> lock held while that league is being built
+            self.box_scores_cache = {}  # (league cache key, week) -> (fetched at, box scores)
             # Store credentials separately per-session rather than globally
             secrets = get_credentials()
             if secrets:
@@ -56,32 +306,116 @@ try:
             else:
                 self.credentials = {}
 
-        def get_league(self, session_id, league_id, year=CURRENT_YEAR):
+        def get_session_credentials(self, session_id):
+            """Get the (espn_s2, swid) pair stored for a session, or (None, None) if there isn't one"""
+            credentials = self.credentials.get(session_id, {})
+            return credentials.get('espn_s2'), credentials.get('swid')
+
+        def get_cache_key(self, session_id, league_id, year=CURRENT_YEAR):
+            """Get the league cache key, which includes auth info so public and private views don't collide"""
+            espn_s2, swid = self.get_session_credentials(session_id)
+            return f"{league_id}_{year}_{espn_s2}_{swid}"
+
+        def _build_league(self, league_id, year, espn_s2, swid):
+            """Fetch a league and precompute its search indices. Blocking, so run it in a worker thread"""
+            # Build without fetching so the initial load goes through the shared connection pool too
+            league = League(league_id=league_id, year=year, espn_s2=espn_s2, swid=swid, fetch_league=False)
+            # Completed seasons can't change, so their responses are safe to keep on disk
+            league.espn_request = PooledEspnFantasyRequests(sport='nfl', year=year, league_id=league_id,
+                                                            cookies=league.espn_request.cookies, logger=league.logger,
+                                                            disk_cache=year < CURRENT_YEAR)
+            league.fetch_league()
+
+            # Lowercased search indices for team name / owner / player lookups
+            league._name_index = {}
+            league._owner_index = {}
+            league._player_index = {}
+            for team in league.teams:
+                team.team_name = team.team_name.strip()
+                league._name_index.setdefault(team.team_name.lower(), team)
+                for o in team.owners:
+                    # Built for every league load, so a member missing a name field mustn't break the whole league
+                    owner_name = f"{o.get('firstName', '')} {o.get('lastName', '')} {o.get('displayName', '')}"
+                    league._owner_index.setdefault(owner_name.lower(), team)
+                for player in team.roster:
+                    league._player_index.setdefault(player.name.lower(), player)
+            return league
+
+        async def get_league(self, session_id, league_id, year=CURRENT_YEAR):
             """Get a league instance with caching, using stored credentials if available"""
-            key = f"{league_id}_{year}"
-            
-            # Check if we have credentials for this session
-            espn_s2 = None
-            swid = None
-            if session_id in self.credentials:
-                espn_s2 = self.credentials[session_id].get('espn_s2')
-                swid = self.credentials[session_id].get('swid')
-            
-            # Create league cache key including auth info
-            cache_key = f"{key}_{espn_s2}_{swid}"
-            
-            if cache_key not in self.leagues:
-                log_error(f"Creating new league instance for {league_id}, year {year}")
-                try:
-                    league = League(league_id=league_id, year=year, espn_s2=espn_s2, swid=swid)
-                    for team in league.teams:
-                        team.team_name = team.team_name.strip()
-                    self.leagues[cache_key] = league
-                except Exception as e:
-                    log_error(f"Error creating league: {str(e)}")
-                    raise
+            espn_s2, swid = self.get_session_credentials(session_id)
+            cache_key = self.get_cache_key(session_id, league_id, year)
             
+            league = self.leagues.get(cache_key)
+            if league is not None:
+                self.leagues.move_to_end(cache_key)
+                return league
+
+            # Only build each league once, even if several tool calls ask for it at the same time
+            async with self.league_locks.setdefault(cache_key, asyncio.Lock()):
+                if cache_key not in self.leagues:
+                    log_error(f"Creating new league instance for {league_id}, year {year}")
+                    try:
+                        # League loading is blocking network I/O, so keep it off the event loop
+                        self.leagues[cache_key] = await asyncio.to_thread(self._build_league, league_id, year, espn_s2, swid)
+                    except Exception as e:
+                        log_error(f"Error creating league: {str(e)}")
+                        raise
+                    finally:
+                        # Calls already waiting hold their own reference to the lock, so drop it once the build attempt
+                        # is over. Otherwise failed (e.g. bad or private) league IDs would pile up here
+                        self.league_locks.pop(cache_key, None)
+                    self.evict_leagues()
+
             return self.leagues[cache_key]
+
+        def evict_leagues(self):
+            """Drop least recently used leagues (and their cached box scores) beyond LEAGUE_CACHE_SIZE"""
+            while len(self.leagues) > LEAGUE_CACHE_SIZE:
+                evicted_key, _ = self.leagues.popitem(last=False)
+                for key in [k for k in self.box_scores_cache if k[0] == evicted_key]:
+                    del self.box_scores_cache[key]
+                log_error(f"Evicted league instance {evicted_key.split('_')[0]} from cache")
+
+        async def find_player(self, session_id, league_id, year, player_name):
+            """Find a rostered player by name, preferring an exact (case insensitive) match over a substring match"""
+            league = await self.get_league(session_id, league_id, year)
+            index = league._player_index
+
+            name = player_name.lower()
+            return index.get(name) or next((player for indexed_name, player in index.items() if name in indexed_name), None)
+
+        async def get_box_scores(self, session_id, league_id, year, week, ttl=BOX_SCORES_TTL):
+            """Get box scores for a week, reusing a recent fetch if one is less than ttl seconds old"""
+            league = await self.get_league(session_id, league_id, year)
+            key = (self.get_cache_key(session_id, league_id, year), week)
+
+            cached = self.box_scores_cache.get(key)
+            if cached and time.monotonic() - cached[0] < ttl:
+                return cached[1]
+
+            # Fetch in a worker thread so the event loop isn't blocked on ESPN
+            box_scores = await asyncio.to_thread(league.box_scores, week)
+
+            # Drop expired entries, then the oldest ones if we're still at capacity
+            now = time.monotonic()
+            for stale_key in [k for k, (fetched_at, _) in self.box_scores_cache.items() if now - fetched_at >= ttl]:
+                del self.box_scores_cache[stale_key]
+            while len(self.box_scores_cache) >= BOX_SCORES_CACHE_SIZE:
+                del self.box_scores_cache[next(iter(self.box_scores_cache))]
+
+            self.box_scores_cache[key] = (now, box_scores)
+            return box_scores
+
+        async def get_box_scores_for_weeks(self, session_id, league_id, year, weeks):
+            """Get box scores for several weeks concurrently, running at most MAX_CONCURRENT_FETCHES fetches at once"""
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+
+            async def fetch(week):
+                async with semaphore:
+                    return await self.get_box_scores(session_id, league_id, year, week)
+
+            return await asyncio.gather(*(fetch(week) for week in weeks))
         
         def store_credentials(self, session_id, espn_s2, swid):
             """Store credentials for a session"""
@@ -93,122 +427,164 @@ try:
         
         def clear_credentials(self, session_id):
             """Clear credentials for a session"""
-            if session_id in self.credentials:
-                del self.credentials[session_id]
+            if self.credentials.pop(session_id, None) is not None:
                 log_error(f"Cleared credentials for session {session_id}")
 
     # Create our API instance
     api = ESPNFantasyFootballAPI()
 
+    # Each tool is split into an implementation that returns plain data (or a message string when the request can't be
+    # answered, and raises on errors) and an MCP wrapper that serializes the result and turns errors into messages
+
+    async def _authenticate(espn_s2: str, swid: str) -> str:
+        log_error("Authenticating...")
+        # Store credentials for this session
+        api.store_credentials(SESSION_ID, espn_s2, swid)
+
+        return "Authentication successful. Your credentials are stored for this session only."
+
     @mcp.tool()
     async def authenticate(espn_s2: str, swid: str) -> str:
         """Store ESPN authentication credentials for this session. Should be done automatically on server start, but can be done manually if needed.
-        
+
         Args:
             espn_s2: The ESPN_S2 cookie value from your ESPN account
             swid: The SWID cookie value from your ESPN account
         """
         try:
-            log_error("Authenticating...")
-            # Store credentials for this session
-            api.store_credentials(SESSION_ID, espn_s2, swid)
-            
-            return "Authentication successful. Your credentials are stored for this session only."
+            return await _authenticate(espn_s2, swid)
         except Exception as e:
-            log_error(f"Authentication error: {str(e)}")
-            traceback.print_exc(file=sys.stderr)
+            log_exception("Authentication error", e)
             return f"Authentication error: {str(e)}"
 
+    async def _get_league_info(league_id: int, year: int = CURRENT_YEAR) -> dict | str:
+        log_error(f"Getting league info for league {league_id}, year {year}")
+        # Get league using stored credentials
+        league = await api.get_league(SESSION_ID, league_id, year)
+        info = {
+            "name": league.settings.name,
+            "year": league.year,
+            "current_week": league.current_week,
+            "nfl_week": league.nfl_week,
+            "team_count": len(league.teams),
+            "teams": [team.team_name for team in league.teams],
+            "scoring_type": league.settings.scoring_type,
+        }
+
+        return info
+
     @mcp.tool()
     async def get_league_info(league_id: int, year: int = CURRENT_YEAR) -> str:
         """Get basic information about a fantasy football league.
-        
+
         Args:
             league_id: The ESPN fantasy football league ID
             year: Optional year for historical data (defaults to current season)
         """
         try:
-            log_error(f"Getting league info for league {league_id}, year {year}")
-            # Get league using stored credentials
-            league = api.get_league(SESSION_ID, league_id, year)
-            
-            info = {
-                "name": league.settings.name,
-                "year": league.year,
-                "current_week": league.current_week,
-                "nfl_week": league.nfl_week,
-                "team_count": len(league.teams),
-                "teams": [team.team_name for team in league.teams],
-                "scoring_type": league.settings.scoring_type,
-            }
-            
-            return str(info)
+            return tool_result(await _get_league_info(league_id, year))
         except Exception as e:
-            log_error(f"Error retrieving league info: {str(e)}")
-            traceback.print_exc(file=sys.stderr)
-            if "401" in str(e) or "Private" in str(e):
-                return ("This appears to be a private league. Please use the authenticate tool first with your "
-                      "ESPN_S2 and SWID cookies to access private leagues.")
-            return f"Error retrieving league: {str(e)}"
+            return handle_error("Error retrieving league", e)
+
+    async def _get_team_roster(league_id: int, team_id: int, year: int = CURRENT_YEAR) -> dict | str:
+        log_error(f"Getting team roster for league {league_id}, team {team_id}, year {year}")
+        # Get league using stored credentials
+        league = await api.get_league(SESSION_ID, league_id, year)
+
+        # Team IDs in ESPN API are 1-based
+        if team_id < 1 or team_id > len(league.teams):
+            return f"Invalid team_id. Must be between 1 and {len(league.teams)}"
+
+        team = league.teams[team_id - 1]
+
+        roster_info = {
+            "team_name": team.team_name,
+            "owner": team.owners,
+            "wins": team.wins,
+            "losses": team.losses,
+            "roster": []
+        }
+
+        for player in team.roster:
+            season_stats, current_week_stats, next_week_stats = player.stats.values()
+            player_info = {
+                "name": player.name,
+                "position": player.position,
+                "proTeam": player.proTeam,
+                "injuryStatus": player.injuryStatus,
+            }
+            if player.total_points:
+                player_info["season_total_points"] = player.total_points
+            if player.projected_total_points:
+                player_info["projected_season_total_points"] = player.projected_total_points
+            player_info["season_stats"] = season_stats
+            player_info["current_week_stats"] = current_week_stats
+            player_info["next_week_projected_stats"] = next_week_stats
+            roster_info["roster"].append(player_info)
+
+        return roster_info
 
     @mcp.tool()
     async def get_team_roster(league_id: int, team_id: int, year: int = CURRENT_YEAR) -> str:
         """Get a team's current roster.
-        
+
         Args:
             league_id: The ESPN fantasy football league ID
             team_id: The team ID in the league (usually 1-12)
             year: Optional year for historical data (defaults to current season)
         """
         try:
-            log_error(f"Getting team roster for league {league_id}, team {team_id}, year {year}")
-            # Get league using stored credentials
-            league = api.get_league(SESSION_ID, league_id, year)
-            
+            return tool_result(await _get_team_roster(league_id, team_id, year))
+        except Exception as e:
+            return handle_error("Error retrieving team roster", e)
+
+    async def _get_team_info(league_id: int, team_id: int = None, team_name: str = "", owner: str = "", year: int = CURRENT_YEAR) -> dict | str:
+        log_error(f"Getting team roster for league {league_id}, team {team_id}, year {year}")
+        # Get league using stored credentials
+        league = await api.get_league(SESSION_ID, league_id, year)
+
+        team = None
+        if team_id:
             # Team IDs in ESPN API are 1-based
             if team_id < 1 or team_id > len(league.teams):
                 return f"Invalid team_id. Must be between 1 and {len(league.teams)}"
-            
             team = league.teams[team_id - 1]
-            
-            roster_info = {
-                "team_name": team.team_name,
-                "owner": team.owners,
-                "wins": team.wins,
-                "losses": team.losses, 
-                "roster": []
-            }
-            
-            for player in team.roster:
-                [season_stats_key, current_week_key, next_week_key] = player.stats.keys()
-                season_stats = player.stats[season_stats_key]
-                current_week_stats = player.stats[current_week_key]
-                next_week_stats = player.stats[next_week_key]
-                roster_info["roster"].append({
-                    "name": player.name,
-                    "position": player.position,
-                    "proTeam": player.proTeam,
-                    "injuryStatus": player.injuryStatus,
-                    **({"season_total_points": player.total_points} if player.total_points else {}),
-                    **({"projected_season_total_points": player.projected_total_points} if player.projected_total_points else {}),
-                    "season_stats": season_stats,
-                    "current_week_stats": current_week_stats,
-                    "next_week_projected_stats": next_week_stats
-                })
-            
-            return str(roster_info)
-        except Exception as e:
-            log_error(f"Error retrieving team roster: {str(e)}")
-            traceback.print_exc(file=sys.stderr)
-            if "401" in str(e) or "Private" in str(e):
-                return ("This appears to be a private league. Please use the authenticate tool first with your "
-                      "ESPN_S2 and SWID cookies to access private leagues.")
-            return f"Error retrieving team roster: {str(e)}"
-        
+        elif team_name:
+            search_term = team_name.lower()
+            team = next((t for name, t in league._name_index.items() if search_term in name), None)
+            if not team:
+                return f"Team with name containing '{team_name}' not found in league {league_id}"
+        elif owner:
+            search_term = owner.lower()
+            team = next((t for name, t in league._owner_index.items() if search_term in name), None)
+            if not team:
+                return f"Team with owner containing '{owner}' not found in league {league_id}"
+        else:
+            return "Invalid input. Please provide either team_id, team_name, or owner to identify the team."
+
+        team_info = {
+            "team_id": team.team_id,
+            "team_name": team.team_name,
+            "owner": team.owners,
+            "wins": team.wins,
+            "losses": team.losses,
+            "ties": team.ties,
+            "points_for": team.points_for,
+            "points_against": team.points_against,
+            "acquisitions": team.acquisitions,
+            "drops": team.drops,
+            "trades": team.trades,
+            "playoff_pct": team.playoff_pct,
+            "final_standing": team.final_standing,
+            "outcomes": team.outcomes
+        }
+
+        return team_info
+
     @mcp.tool()
     async def get_team_info(league_id: int, team_id: int = None, team_name: str = "", owner: str = "", year: int = CURRENT_YEAR) -> str:
         """Get a team's general information using its ID, team name, or owner's name. Must include at least one of the three. Return value includes points scored, transactions, etc.
-        
+
         Args:
             league_id: The ESPN fantasy football league ID
             team_id: Optional team ID to search for (1-based index, usually 1-12)
@@ -217,321 +593,315 @@ try:
             year: Optional year for historical data (defaults to current season)
         """
         try:
-            log_error(f"Getting team roster for league {league_id}, team {team_id}, year {year}")
-            # Get league using stored credentials
-            league = api.get_league(SESSION_ID, league_id, year)
-
-            team = None
-            if team_id:
-                # Team IDs in ESPN API are 1-based
-                if team_id < 1 or team_id > len(league.teams):
-                    return f"Invalid team_id. Must be between 1 and {len(league.teams)}"
-                team = league.teams[team_id - 1]
-            elif team_name:
-                for t in league.teams:
-                    if team_name.lower() in t.team_name.lower():
-                        team = t
-                        break
-                if not team:
-                    return f"Team with name containing '{team_name}' not found in league {league_id}"
-            elif owner:
-                for t in league.teams:
-                    if any(owner.lower() in f"{o['firstName']} {o['lastName']} {o['displayName']}".lower() for o in t.owners):
-                        team = t
-                        break
-                if not team:
-                    return f"Team with owner containing '{owner}' not found in league {league_id}"
-            else:
-                return "Invalid input. Please provide either team_id, team_name, or owner to identify the team."
-            
-            team_info = {
-                "team_id": team.team_id,
-                "team_name": team.team_name,
-                "owner": team.owners,
-                "wins": team.wins,
-                "losses": team.losses,
-                "ties": team.ties,
-                "points_for": team.points_for,
-                "points_against": team.points_against,
-                "acquisitions": team.acquisitions,
-                "drops": team.drops,
-                "trades": team.trades,
-                "playoff_pct": team.playoff_pct,
-                "final_standing": team.final_standing,
-                "outcomes": team.outcomes
-            }
-            
-            return str(team_info)
-
+            return tool_result(await _get_team_info(league_id, team_id, team_name, owner, year))
         except Exception as e:
-            log_error(f"Error retrieving team results: {str(e)}")
-            traceback.print_exc(file=sys.stderr)
-            if "401" in str(e) or "Private" in str(e):
-                return ("This appears to be a private league. Please use the authenticate tool first with your "
-                      "ESPN_S2 and SWID cookies to access private leagues.")
-            return f"Error retrieving team results: {str(e)}"
+            return handle_error("Error retrieving team results", e)
+
+    async def _get_player_stats(league_id: int, player_name: str, year: int = CURRENT_YEAR) -> dict | str:
+        log_error(f"Getting player stats for {player_name} in league {league_id}, year {year}")
+        # Search for player by name using stored credentials
+        player = await api.find_player(SESSION_ID, league_id, year, player_name)
+
+        if not player:
+            return f"Player '{player_name}' not found in league {league_id}"
+
+        # Get player stats
+        stats = {
+            "name": player.name,
+            "position": player.position,
+            "team": player.proTeam,
+            "points": player.total_points,
+            "projected_points": player.projected_total_points,
+            "stats": player.stats,
+            "injured": player.injured
+        }
+
+        return stats
 
     @mcp.tool()
     async def get_player_stats(league_id: int, player_name: str, year: int = CURRENT_YEAR) -> str:
         """Get stats for a specific player.
-        
+
         Args:
             league_id: The ESPN fantasy football league ID
             player_name: Name of the player to search for
             year: Optional year for historical data (defaults to current season)
         """
         try:
-            log_error(f"Getting player stats for {player_name} in league {league_id}, year {year}")
-            # Get league using stored credentials
-            league = api.get_league(SESSION_ID, league_id, year)
-            
-            # Search for player by name
-            player = None
-            for team in league.teams:
-                for roster_player in team.roster:
-                    if player_name.lower() in roster_player.name.lower():
-                        player = roster_player
-                        break
-                if player:
-                    break
-            
-            if not player:
-                return f"Player '{player_name}' not found in league {league_id}"
-            
-            # Get player stats
-            stats = {
-                "name": player.name,
-                "position": player.position,
-                "team": player.proTeam,
-                "points": player.total_points,
-                "projected_points": player.projected_total_points,
-                "stats": player.stats,
-                "injured": player.injured
-            }
-            
-            return str(stats)
+            return tool_result(await _get_player_stats(league_id, player_name, year))
         except Exception as e:
-            log_error(f"Error retrieving player stats: {str(e)}")
-            traceback.print_exc(file=sys.stderr)
-            if "401" in str(e) or "Private" in str(e):
-                return ("This appears to be a private league. Please use the authenticate tool first with your "
-                      "ESPN_S2 and SWID cookies to access private leagues.")
-            return f"Error retrieving player stats: {str(e)}"
+            return handle_error("Error retrieving player stats", e)
+
+    async def _get_league_standings(league_id: int, year: int = CURRENT_YEAR) -> list[dict] | str:
+        log_error(f"Getting league standings for league {league_id}, year {year}")
+        # Get league using stored credentials
+        league = await api.get_league(SESSION_ID, league_id, year)
+
+        # Sort teams by wins (descending), then points (descending)
+        sorted_teams = sorted(league.teams,
+                            key=lambda x: (x.wins, x.points_for),
+                            reverse=True)
+
+        standings = []
+        for i, team in enumerate(sorted_teams):
+            standings.append({
+                "rank": i + 1,
+                "team_name": team.team_name,
+                "owner": team.owners,
+                "wins": team.wins,
+                "losses": team.losses,
+                "points_for": team.points_for,
+                "points_against": team.points_against
+            })
+
+        return standings
 
     @mcp.tool()
     async def get_league_standings(league_id: int, year: int = CURRENT_YEAR) -> str:
         """Get current standings for a league.
-        
+
         Args:
             league_id: The ESPN fantasy football league ID
             year: Optional year for historical data (defaults to current season)
         """
         try:
-            log_error(f"Getting league standings for league {league_id}, year {year}")
-            # Get league using stored credentials
-            league = api.get_league(SESSION_ID, league_id, year)
-            
-            # Sort teams by wins (descending), then points (descending)
-            sorted_teams = sorted(league.teams, 
-                                key=lambda x: (x.wins, x.points_for),
-                                reverse=True)
-            
-            standings = []
-            for i, team in enumerate(sorted_teams):
-                standings.append({
-                    "rank": i + 1,
-                    "team_name": team.team_name,
-                    "owner": team.owners,
-                    "wins": team.wins,
-                    "losses": team.losses,
-                    "points_for": team.points_for,
-                    "points_against": team.points_against
-                })
-            
-            return str(standings)
+            return tool_result(await _get_league_standings(league_id, year))
         except Exception as e:
-            log_error(f"Error retrieving league standings: {str(e)}")
-            traceback.print_exc(file=sys.stderr)
-            if "401" in str(e) or "Private" in str(e):
-                return ("This appears to be a private league. Please use the authenticate tool first with your "
-                      "ESPN_S2 and SWID cookies to access private leagues.")
-            return f"Error retrieving league standings: {str(e)}"
+            return handle_error("Error retrieving league standings", e)
+
+    async def _get_weekly_matchups(league_id: int, week: int = None, year: int = CURRENT_YEAR) -> list[MatchupSummary] | str:
+        # Get league using stored credentials
+        league = await api.get_league(SESSION_ID, league_id, year)
+
+        if week is None:
+            prev_week = league.current_week - 1
+            log_error(f"No week provided, using previous week (Week {prev_week})")
+            week = prev_week
+
+        log_error(f"Getting matchup info for league {league_id}, week {week}, year {year}")
+
+        # The league's last scoring period covers leagues that run into week 18
+        if week < 1 or week > league.finalScoringPeriod:
+            return f"Invalid week number. Must be between 1 and {league.finalScoringPeriod}"
+
+        matchups = await api.get_box_scores(SESSION_ID, league_id, year, week)
+
+        return [summarize_matchup(matchup) for matchup in matchups]
 
     @mcp.tool()
     async def get_weekly_matchups(league_id: int, week: int = None, year: int = CURRENT_YEAR) -> str:
         """Get basic matchup information for all matchups in a specific week, including team names, owners, and scores.
-        
+
         Args:
             league_id: The ESPN fantasy football league ID
             week: The week number (if None, uses previous week)
             year: Optional year for historical data (defaults to current season)
         """
         try:
-            # Get league using stored credentials
-            league = api.get_league(SESSION_ID, league_id, year)
-            
-            if week is None:
-                prev_week = league.current_week - 1
-                log_error(f"No week provided, using previous week (Week {prev_week})")
-                week = prev_week
-
-            log_error(f"Getting matchup info for league {league_id}, week {week}, year {year}")
-                
-            if week < 1 or week > 17:  # Most leagues have 17 weeks max
-                return f"Invalid week number. Must be between 1 and 17"
-            
-            matchups = league.box_scores(week)
-            
-            matchup_info = []
-            for matchup in matchups:
-                matchup_info.append({
-                    "home_team_id": matchup.home_team.team_id,
-                    "home_team": matchup.home_team.team_name,
-                    "home_team_owner_name": get_owner_name(matchup.home_team),
-                    "home_score": matchup.home_score,
-                    "away_team_id": matchup.away_team.team_id if matchup.away_team else None,
-                    "away_team": matchup.away_team.team_name if matchup.away_team else "BYE",
-                    "away_team_owner_name": get_owner_name(matchup.away_team) if matchup.away_team else None,
-                    "away_score": matchup.away_score if matchup.away_team else 0,
-                    "winner": "HOME" if matchup.home_score > matchup.away_score else "AWAY" if matchup.away_score > matchup.home_score else "TIE"
-                })
-            
-            return str(matchup_info)
+            return tool_result(await _get_weekly_matchups(league_id, week, year))
         except Exception as e:
-            log_error(f"Error retrieving matchup information: {str(e)}")
-            traceback.print_exc(file=sys.stderr)
-            if "401" in str(e) or "Private" in str(e):
-                return ("This appears to be a private league. Please use the authenticate tool first with your "
-                      "ESPN_S2 and SWID cookies to access private leagues.")
-            return f"Error retrieving matchup information: {str(e)}"
-    
+            return handle_error("Error retrieving matchup information", e)
+
+    async def _get_detailed_matchup_info(league_id: int, competitors: list, week: int = None, year: int = CURRENT_YEAR, fields: list[str] = None) -> list[dict] | str:
+        log_error(f"Getting matchup info for league {league_id}, week {week}, year {year}")
+        # Get league using stored credentials
+        league = await api.get_league(SESSION_ID, league_id, year)
+
+        # Default to previous week if not provided (every Tuesday starts a new week, and I almost always use this on Tuesdays)
+        if week is None:
+            week = league.current_week - 1
+
+        # The league's last scoring period covers leagues that run into week 18
+        if week < 1 or week > league.finalScoringPeriod:
+            return f"Invalid week number. Must be between 1 and {league.finalScoringPeriod}"
+
+        if not competitors:
+            return "No competitors provided. Please provide a list of team IDs to filter matchups by."
+
+        # Filter matchups by competitors
+        def filter_matchups_by_competitors(matchups, competitors) -> list:
+            filtered_matchups = []
+
+            # Index the week's matchups once instead of rebuilding search strings for every competitor
+            matchups_by_team_id = {}
+            matchups_by_search_name = {}
+            for matchup in matchups:
+                for team in (matchup.home_team, matchup.away_team):
+                    if team:
+                        matchups_by_team_id.setdefault(team.team_id, matchup)
+                        matchups_by_search_name.setdefault(f"{team.team_name} ({get_owner_name(team)})".lower(), matchup)
+
+            for c in competitors:
+                if isinstance(c, int):
+                    matchup = matchups_by_team_id.get(c)
+                else:
+                    search_term = c.lower()
+                    matchup = next((m for name, m in matchups_by_search_name.items() if search_term in name), None)
+                if matchup and matchup not in filtered_matchups:
+                    filtered_matchups.append(matchup)
+
+            return filtered_matchups
+
+        matchups = filter_matchups_by_competitors(await api.get_box_scores(SESSION_ID, league_id, year, week), competitors)
+        if not matchups:
+            return f"No matchups found for {competitors} in week {week}"
+
+        is_current_week = week == league.current_week
+
+        def resolve_lineup(lineup) -> list[LineupPlayer]:
+            roster = []
+            for player in lineup:
+                total_points = player.total_points
+                projected_total_points = player.projected_total_points
+                player_info = {
+                    "name": player.name,
+                    "position": player.position,
+                    "proTeam": player.proTeam,
+                    "injuryStatus": player.injuryStatus,
+                }
+                if total_points:
+                    player_info["season_total_points"] = total_points
+                if projected_total_points:
+                    player_info["projected_season_total_points"] = projected_total_points
+                player_info["lineupSlot"] = player.lineupSlot
+
+                stat_values = player.stats.values()
+                # Check if player has stats for this week (if not, they may be on bye)
+                if stat_values:
+                    if is_current_week:
+                        player_info["season_stats"], player_info["weekly_stats"], player_info["projected_stats"] = stat_values
+                    else:
+                        [player_info["weekly_stats"]] = stat_values
+                roster.append(cast(LineupPlayer, player_info))
+            return roster
+
+        field_tree = parse_fields(fields) if fields else None
+        # Skip resolving lineups entirely when the requested fields don't include them
+        include_lineups = field_tree is None or "home_lineup" in field_tree or "away_lineup" in field_tree
+        lineup_resolver = resolve_lineup if include_lineups else None
+
+        return [project_fields(summarize_matchup(matchup, lineup_resolver), field_tree) for matchup in matchups]
+
     @mcp.tool()
-    async def get_detailed_matchup_info(league_id: int, competitors: list, week: int = None, year: int = CURRENT_YEAR) -> str:
+    async def get_detailed_matchup_info(league_id: int, competitors: list, week: int = None, year: int = CURRENT_YEAR, fields: list[str] = None) -> str | list[TextContent]:
         """Get detailed matchup information for a specific week and list of competitors, including lineup info and player stats.
+        Each matchup is returned as its own JSON object.
 
         Args:
             league_id: The ESPN fantasy football league ID
             competitors: List of team names, owner names, or IDs to filter matchups by (if multiple provided, will include all matchups with at least one of the teams)
             week: The week number (if None, uses current week)
             year: Optional year for historical data (defaults to current season)
+            fields: Optional list of dotted field paths to return instead of everything, e.g. ["home_team", "home_lineup.name", "home_lineup.weekly_stats.points"]
         """
         try:
-            log_error(f"Getting matchup info for league {league_id}, week {week}, year {year}")
-            # Get league using stored credentials
-            league = api.get_league(SESSION_ID, league_id, year)
-            
-            # Default to previous week if not provided (every Tuesday starts a new week, and I almost always use this on Tuesdays)
-            if week is None:
-                week = league.current_week - 1
-                
-            if week < 1 or week > 17:  # Most leagues have 17 weeks max
-                return f"Invalid week number. Must be between 1 and 17"
-
-            if not competitors:
-                return "No competitors provided. Please provide a list of team IDs to filter matchups by."
-
-            # Filter matchups by competitors
-            def filter_matchups_by_competitors(matchups, competitors) -> list:
-                filtered_matchups = []
-
-                def find_team_matchup(matchup_list, competitor):
-                    is_team_id = isinstance(competitor, int)
-                    found = None
-                    for matchup in matchup_list:
-                        if is_team_id:
-                            if matchup.home_team.team_id == competitor or (matchup.away_team and matchup.away_team.team_id == competitor):
-                                found = matchup
-                                break
-                        else:
-                            search_term = competitor.lower()
-                            home = f"{matchup.home_team.team_name} ({get_owner_name(matchup.home_team)})".lower()
-                            away = f"{matchup.away_team.team_name} ({get_owner_name(matchup.away_team)})".lower() if matchup.away_team else "BYE"
-                            if search_term in home or search_term in away:
-                                found = matchup
-                                break
-
-                    return found
-                
-                for c in competitors:
-                    matchup = find_team_matchup(matchups, c)
-                    if matchup and matchup not in filtered_matchups:
-                        filtered_matchups.append(matchup)
-
-                return filtered_matchups
-
-            matchups = filter_matchups_by_competitors(league.box_scores(week), competitors)
-
-            def resolve_lineup(lineup):
-                roster = []
-                for player in lineup:
-                    stats = {}
-                    stat_keys = player.stats.keys()
-                    # Check if player has stats for this week (if not, they may be on bye)
-                    if len(stat_keys) > 0:
-                        if week == league.current_week:
-                            [season_stats_key, current_week_key, next_week_key] = player.stats.keys()
-                            stats = {
-                                "season_stats": player.stats[season_stats_key],
-                                "weekly_stats": player.stats[current_week_key],
-                                "projected_stats": player.stats[next_week_key]
-                            }
-                        else:
-                            [current_week_key] = player.stats.keys()
-                            stats = {
-                                "weekly_stats": player.stats[current_week_key]
-                            }
-                    roster.append({
-                        "name": player.name,
-                        "position": player.position,
-                        "proTeam": player.proTeam,
-                        "injuryStatus": player.injuryStatus,
-                        **({"season_total_points": player.total_points} if player.total_points else {}),
-                        **({"projected_season_total_points": player.projected_total_points} if player.projected_total_points else {}),
-                        "lineupSlot": player.lineupSlot,
-                        **stats
-                    })
-                return roster
-
-            matchup_info = []
-            for matchup in matchups:
-                matchup_info.append({
-                    "home_team_id": matchup.home_team.team_id,
-                    "home_team": matchup.home_team.team_name,
-                    "home_team_owner_name": get_owner_name(matchup.home_team),
-                    "home_score": matchup.home_score,
-                    "home_lineup": resolve_lineup(matchup.home_lineup),
-                    "away_team_id": matchup.away_team.team_id if matchup.away_team else None,
-                    "away_team": matchup.away_team.team_name if matchup.away_team else "BYE",
-                    "away_team_owner_name": get_owner_name(matchup.away_team) if matchup.away_team else None,
-                    "away_score": matchup.away_score if matchup.away_team else 0,
-                    "away_lineup": resolve_lineup(matchup.away_lineup) if matchup.away_team else [],
-                    "winner": "HOME" if matchup.home_score > matchup.away_score else "AWAY" if matchup.away_score > matchup.home_score else "TIE"
-                })
-
-            return str(matchup_info)
+            matchups = await _get_detailed_matchup_info(league_id, competitors, week, year, fields)
+            if isinstance(matchups, str):
+                return matchups
+
+            # Serialize each matchup separately so a client can start on the first one without waiting for the rest
+            return [TextContent(type="text", text=to_json(matchup)) for matchup in matchups]
+        except Exception as e:
+            return handle_error("Error retrieving matchup information", e)
+
+    async def _get_season_max_score(league_id: int, through_week: int = None, year: int = CURRENT_YEAR) -> dict | str:
+        log_error(f"Getting season max score for league {league_id}, through week {through_week}, year {year}")
+        # Get league using stored credentials
+        league = await api.get_league(SESSION_ID, league_id, year)
+
+        # Once a season is over (including the current one between January and July) its current week is capped at
+        # the final week, which is already complete. Later weeks can't be used since ESPN answers box score requests
+        # past the current week with the current week's scores
+        season_over = year < CURRENT_YEAR or league.scoringPeriodId > league.finalScoringPeriod
+        last_completed_week = league.current_week if season_over else league.current_week - 1
+        if last_completed_week < 1:
+            return f"No weeks have been completed yet in league {league_id}"
+
+        if through_week is None:
+            through_week = last_completed_week
+
+        if through_week < 1 or through_week > last_completed_week:
+            return f"Invalid week number. Must be between 1 and {last_completed_week}"
+
+        weeks = range(1, through_week + 1)
+        weekly_box_scores = await api.get_box_scores_for_weeks(SESSION_ID, league_id, year, weeks)
+
+        # Matchups that span several weeks (often the playoffs) are scored on their combined total, so for
+        # those weeks add up the starters' points for just that week instead
+        multi_week_periods = {week for periods in league.settings.matchup_periods.values() if len(periods) > 1
+                              for week in periods}
+
+        def week_score(week, score, lineup):
+            if week not in multi_week_periods:
+                return score
+            return round(sum(player.points for player in lineup if player.lineupSlot not in ("BE", "IR")), 2)
+
+        scores = (
+            (week_score(week, score, lineup), week, team)
+            for week, box_scores in zip(weeks, weekly_box_scores)
+            for matchup in box_scores
+            for team, score, lineup in ((matchup.home_team, matchup.home_score, matchup.home_lineup),
+                                        (matchup.away_team, matchup.away_score, matchup.away_lineup))
+            if team
+        )
+        best = max(scores, key=lambda entry: entry[0], default=None)
+        if not best:
+            return f"No scores found in league {league_id} through week {through_week}"
+
+        score, week, team = best
+        return {
+            "max_score": score,
+            "week": week,
+            "team_id": team.team_id,
+            "team": team.team_name,
+            "team_owner_name": get_owner_name(team),
+        }
+
+    @mcp.tool()
+    async def get_season_max_score(league_id: int, through_week: int = None, year: int = CURRENT_YEAR) -> str:
+        """Get the highest single-week team score of the season, along with the week it happened and the team that scored it.
+
+        Args:
+            league_id: The ESPN fantasy football league ID
+            through_week: Optional last week to include (defaults to, and can't be after, the last completed week)
+            year: Optional year for historical data (defaults to current season)
+        """
+        try:
+            return tool_result(await _get_season_max_score(league_id, through_week, year))
         except Exception as e:
-            log_error(f"Error retrieving matchup information: {str(e)}")
-            traceback.print_exc(file=sys.stderr)
-            if "401" in str(e) or "Private" in str(e):
-                return ("This appears to be a private league. Please use the authenticate tool first with your "
-                      "ESPN_S2 and SWID cookies to access private leagues.")
-            return f"Error retrieving matchup information: {str(e)}"
+            return handle_error("Error retrieving season max score", e)
 
+    async def _logout() -> str:
+        log_error("Logging out...")
+        # Clear credentials for this session
+        api.clear_credentials(SESSION_ID)
+
+        return "Authentication credentials have been cleared."
 
     @mcp.tool()
     async def logout() -> str:
         """Clear stored authentication credentials for this session."""
         try:
-            log_error("Logging out...")
-            # Clear credentials for this session
-            api.clear_credentials(SESSION_ID)
-            
-            return "Authentication credentials have been cleared."
+            return await _logout()
         except Exception as e:
-            log_error(f"Error logging out: {str(e)}")
-            traceback.print_exc(file=sys.stderr)
+            log_exception("Error logging out", e)
             return f"Error logging out: {str(e)}"
 
+    # Tool implementations by tool name, so in-process callers can await them directly and get plain dicts and lists
+    # back, skipping mcp.call_tool's argument validation and the JSON round trip. Unlike the tools, they raise on errors
+    TOOLS = {
+        "authenticate": _authenticate,
+        "get_league_info": _get_league_info,
+        "get_team_roster": _get_team_roster,
+        "get_team_info": _get_team_info,
+        "get_player_stats": _get_player_stats,
+        "get_league_standings": _get_league_standings,
+        "get_weekly_matchups": _get_weekly_matchups,
+        "get_detailed_matchup_info": _get_detailed_matchup_info,
+        "get_season_max_score": _get_season_max_score,
+        "logout": _logout,
+    }
+
     if __name__ == "__main__":
         # Run the server
         log_error("Starting MCP server...")
@@ -543,6 +913,5 @@ except Exception as e:
     # Keep the process running to see logs
     log_error("Server failed to start, but kept running for logging. Press Ctrl+C to exit.")
     # Wait indefinitely to keep the process alive for logs
-    import time
     while True:
         time.sleep(10)
\ No newline at end of file